@@ -25,7 +25,13 @@ from rss_to_wp.feeds import (
     parse_feed,
     pick_entries,
 )
-from rss_to_wp.images import download_image, find_fallback_image, find_rss_image, scrape_image_from_url
+from rss_to_wp.images import (
+    download_image,
+    find_fallback_image,
+    find_rss_image,
+    scrape_image_from_url,
+    scrape_images,
+)
 from rss_to_wp.rewriter import OpenAIRewriter
 from rss_to_wp.storage import DedupeStore
 from rss_to_wp.utils import get_logger, setup_logging, send_email_notification, build_summary_email
@@ -268,6 +274,10 @@ def process_feed(
 
     logger.info("entries_to_process", name=feed_config.name, count=len(entries))
 
+    # Look up each new entry's feed image once, and scrape the source pages
+    # that need it concurrently rather than one at a time in process_entry
+    prefetched_images = prefetch_scraped_images(entries, feed_config, dedupe_store, logger)
+
     for entry in entries:
         try:
             # Generate unique key
@@ -293,6 +303,7 @@ def process_feed(
                 dry_run=dry_run,
                 logger=logger,
                 config_path=config_path,
+                images=prefetched_images.get(entry_key),
             )
 
             if result:
@@ -334,6 +345,67 @@ def process_feed(
     return (processed, skipped, errors)
 
 
+def prefetch_scraped_images(
+    entries: list,
+    feed_config: FeedConfig,
+    dedupe_store: DedupeStore,
+    logger,
+) -> dict[str, dict[str, Optional[str]]]:
+    """Look up images for a feed's new entries, scraping source pages concurrently.
+
+    Each entry's feed image is found once here. Source pages that will be
+    scraped (no feed image, or the feed has a default image) are fetched
+    in one concurrent batch instead of one at a time in process_entry.
+
+    Returns:
+        Per entry key, a dict with "rss" (feed image URL or None) and, if
+        the page was scraped, "scraped" (image URL or None). Entries whose
+        lookup failed are left out so process_entry handles them itself.
+    """
+    images: dict[str, dict[str, Optional[str]]] = {}
+    scrape_keys = []
+    scrape_links = []
+
+    for entry in entries:
+        try:
+            entry_key = generate_entry_key(entry, feed_config.url)
+            if dedupe_store.is_processed(entry_key):
+                continue
+
+            link = get_entry_link(entry)
+            entry_images: dict[str, Optional[str]] = {}
+            # process_entry only looks for a feed image without a default one
+            if not feed_config.default_image:
+                entry_images["rss"] = find_rss_image(entry, base_url=link or "")
+            images[entry_key] = entry_images
+
+            if link and not entry_images.get("rss"):
+                scrape_keys.append(entry_key)
+                scrape_links.append(link)
+
+        except Exception as e:
+            logger.warning(
+                "image_prefetch_error",
+                title=get_entry_title(entry)[:50],
+                error=str(e),
+            )
+
+    if not scrape_links:
+        return images
+
+    try:
+        scraped = scrape_images(scrape_links)
+    except Exception as e:
+        # Leave these pages to the per-entry scrape in process_entry
+        logger.warning("image_prefetch_scrape_error", count=len(scrape_links), error=str(e))
+        return images
+
+    for entry_key, scraped_image_url in zip(scrape_keys, scraped):
+        images[entry_key]["scraped"] = scraped_image_url
+
+    return images
+
+
 def process_entry(
     entry,
     feed_config: FeedConfig,
@@ -343,9 +415,14 @@ def process_entry(
     dry_run: bool,
     logger,
     config_path: str = "",
+    images: Optional[dict[str, Optional[str]]] = None,
 ) -> Optional[dict]:
     """Process a single RSS entry.
 
+    Args:
+        images: Image lookups already done for this entry, with "rss" and/or
+            "scraped" keys (see prefetch_scraped_images).
+
     Returns:
         WordPress post data if successful, None otherwise.
     """
@@ -389,7 +466,10 @@ def process_entry(
     # Try RSS image if no default image set or found
     image_url = None
     if not image_result:
-        image_url = find_rss_image(entry, base_url=link or "")
+        if images and "rss" in images:
+            image_url = images["rss"]
+        else:
+            image_url = find_rss_image(entry, base_url=link or "")
 
         if image_url:
             logger.info("using_rss_image", url=image_url)
@@ -399,7 +479,10 @@ def process_entry(
 
     # Try scraping image from source URL if RSS image not found
     if not image_url and link:
-        scraped_image_url = scrape_image_from_url(link)
+        if images and "scraped" in images:
+            scraped_image_url = images["scraped"]
+        else:
+            scraped_image_url = scrape_image_from_url(link)
         if scraped_image_url:
             logger.info("using_scraped_image", url=scraped_image_url)
             image_result = download_image(scraped_image_url)
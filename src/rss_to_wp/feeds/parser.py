@@ -7,12 +7,41 @@ from typing import Any, Optional
 
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
-from rss_to_wp.utils import get_logger
+from rss_to_wp.utils import get_logger, sniff_encoding, xpath_has_class
 
 logger = get_logger("feeds.parser")
 
+# Bytes read per chunk when streaming article pages into the parser
+ARTICLE_CHUNK_SIZE = 16384
+
+# Elements stripped before extracting article text
+UNWANTED_ELEMENTS_XPATH = etree.XPath(
+    "//script | //style | //nav | //header | //footer | //aside | //iframe | //noscript"
+)
+
+# Main article content lookups, in priority order (first match per selector)
+# Athletics sites often use these selectors
+ARTICLE_CONTENT_XPATHS = [
+    (selector, etree.XPath(f"({path})[1]"))
+    for selector, path in [
+        ("article .article-body", f"//article//*[{xpath_has_class('article-body')}]"),
+        (".article-content", f"//*[{xpath_has_class('article-content')}]"),
+        (".story-body", f"//*[{xpath_has_class('story-body')}]"),
+        (".article__body", f"//*[{xpath_has_class('article__body')}]"),
+        ("[itemprop='articleBody']", "//*[@itemprop='articleBody']"),
+        (".node-content", f"//*[{xpath_has_class('node-content')}]"),
+        (".post-content", f"//*[{xpath_has_class('post-content')}]"),
+        (".entry-content", f"//*[{xpath_has_class('entry-content')}]"),
+        ("article", "//article"),
+        (".content-body", f"//*[{xpath_has_class('content-body')}]"),
+        ("main", "//main"),
+        ("#content", "//*[@id='content']"),
+    ]
+]
+
 
 def parse_feed(url: str) -> Optional[dict[str, Any]]:
     """Parse an RSS/Atom feed from URL.
@@ -70,46 +99,49 @@ def scrape_article_content(url: str) -> Optional[str]:
     logger.info("scraping_article", url=url)
     
     try:
-        response = requests.get(
+        # Stream the body into the parser chunk by chunk instead of
+        # buffering it in response.content first
+        with requests.get(
             url,
             timeout=(10, 30),
             headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            }
-        )
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, "html.parser")
+            },
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=ARTICLE_CHUNK_SIZE)
+            head = next(chunks, b"")
+            if not head:
+                return None
+
+            parser = lxml_html.HTMLParser(
+                encoding=sniff_encoding(response.headers.get("Content-Type", ""), head)
+            )
+            parser.feed(head)
+            for chunk in chunks:
+                parser.feed(chunk)
+            root = parser.close()
+
+        if root is None:
+            return None
         
-        # Remove unwanted elements
-        for element in soup(["script", "style", "nav", "header", "footer", "aside", "iframe", "noscript"]):
-            element.decompose()
+        # Remove unwanted elements. drop_tree() joins the element's tail onto
+        # the text before it, so keep a space there to not glue words together
+        for element in UNWANTED_ELEMENTS_XPATH(root):
+            if element.tail:
+                element.tail = " " + element.tail
+            element.drop_tree()
         
         # Try to find the main article content using common selectors
         article_content = None
         
-        # Athletics sites often use these selectors
-        content_selectors = [
-            "article .article-body",
-            ".article-content",
-            ".story-body",
-            ".article__body",
-            "[itemprop='articleBody']",
-            ".node-content",
-            ".post-content",
-            ".entry-content",
-            "article",
-            ".content-body",
-            "main",
-            "#content",
-        ]
-        
-        for selector in content_selectors:
-            element = soup.select_one(selector)
+        for selector, xpath in ARTICLE_CONTENT_XPATHS:
+            element = xpath(root)
             if element:
                 # Get text content
-                text = element.get_text(separator=" ", strip=True)
+                text = _element_text(element[0])
                 # Only use if it has substantial content
                 if len(text) > 200:
                     article_content = text
@@ -118,9 +150,9 @@ def scrape_article_content(url: str) -> Optional[str]:
         
         # If no article content found, try to get body text
         if not article_content:
-            body = soup.find("body")
-            if body:
-                text = body.get_text(separator=" ", strip=True)
+            body = root.find("body")
+            if body is not None:
+                text = _element_text(body)
                 if len(text) > 200:
                     article_content = text
                     logger.info("scraped_body_fallback", length=len(text))
@@ -140,6 +172,11 @@ def scrape_article_content(url: str) -> Optional[str]:
         return None
 
 
+def _element_text(element: etree._Element) -> str:
+    """Get an element's text as whitespace-stripped pieces joined by spaces."""
+    return " ".join(text.strip() for text in element.itertext() if text.strip())
+
+
 def get_entry_content(entry: dict[str, Any], scrape_if_short: bool = True) -> str:
     """Extract the best available content from an RSS entry.
 
@@ -2,13 +2,19 @@
 
 from rss_to_wp.images.downloader import download_image, extract_keywords, find_fallback_image
 from rss_to_wp.images.pexels import PexelsClient
-from rss_to_wp.images.rss_extractor import find_rss_image, is_valid_image_url, scrape_image_from_url
+from rss_to_wp.images.rss_extractor import (
+    find_rss_image,
+    is_valid_image_url,
+    scrape_image_from_url,
+    scrape_images,
+)
 from rss_to_wp.images.unsplash import UnsplashClient
 
 __all__ = [
     "find_rss_image",
     "is_valid_image_url",
     "scrape_image_from_url",
+    "scrape_images",
     "download_image",
     "extract_keywords",
     "find_fallback_image",
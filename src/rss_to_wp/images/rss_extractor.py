@@ -2,20 +2,104 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
-from typing import Any, Optional
+import sqlite3
+from functools import lru_cache
+from html import unescape
+from typing import Any, Iterator, Optional
 from urllib.parse import urljoin, urlparse
 
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-
-from rss_to_wp.utils import get_logger
+from lxml import etree
+from lxml import html as lxml_html
+
+from rss_to_wp.storage import ImageScrapeCache
+from rss_to_wp.utils import (
+    ENCODING_SNIFF_SIZE,
+    create_http_session,
+    get_logger,
+    get_with_timeout,
+    sniff_encoding,
+    xpath_has_class,
+)
 
 logger = get_logger("images.rss_extractor")
 
 # Valid image extensions
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
 
+# Absolute http(s) URL split into (netloc, path, query)
+HTTP_URL_PATTERN = re.compile(r"https?://([^/?#]+)([^?#]*)(?:\?([^#]*))?", re.IGNORECASE)
+
+# Matches a valid image extension in the last path segment (ignoring trailing slashes)
+# Uses a substring match to catch names like photo.jpg_large
+IMAGE_EXTENSION_PATTERN = re.compile(
+    "(?:" + "|".join(re.escape(ext) for ext in sorted(IMAGE_EXTENSIONS)) + ")[^/]*/*$",
+    re.IGNORECASE,
+)
+
+# Query string format indicators used by image CDNs
+# Example: ?format=jpg, ?type=jpeg, or BMCU/Sidearm's ?image_path=/images/...jpg
+IMAGE_QUERY_PATTERN = re.compile(
+    r"(?:format|type)=(?:jpe?g|png)|^(?=.*image_path=).*\.(?:jpe?g|png)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Image CDNs and athletics sites whose URLs may lack a file extension
+KNOWN_IMAGE_HOSTS = (
+    "pexels.com",
+    "unsplash.com",
+    "cloudinary.com",
+    "imgix.net",
+    "wp.com",
+    "wordpress.com",
+    "flickr.com",
+    "staticflickr.com",
+    "sidearm",  # Sidearm Sports CDN used by athletics sites
+    "prestosports",  # Presto Sports CDN
+    "bmcusports.com",  # Blue Mountain Christian athletics
+    "careyathletics.com",  # William Carey athletics
+    "nwccrangers.com",  # Northwest Mississippi CC athletics
+    "coahomasports.com",  # Coahoma CC athletics
+    "gostatesmen.com",  # Delta State athletics
+    "mvsusports.com",  # Mississippi Valley State athletics
+    "alcornsports.com",  # Alcorn State athletics
+    "gojsutigers.com",  # Jackson State athletics
+    "southernmiss.com",  # Southern Miss athletics
+    "hailstate.com",  # Mississippi State athletics
+    "olemisssports.com",  # Ole Miss athletics
+    "gochoctaws.com",  # Mississippi College athletics
+    "blazers.belhaven.edu",  # Belhaven University athletics
+    "gomajors.com",  # Millsaps College athletics
+    "owlsathletics.com",  # Mississippi University for Women athletics
+    "sports.hindscc.edu",  # Hinds Community College athletics
+    "jcbobcats.com",  # Jones College athletics
+    "southwestbearathletics.com",  # Southwest Mississippi Community College athletics
+)
+KNOWN_IMAGE_HOST_PATTERN = re.compile(
+    "|".join(re.escape(host) for host in KNOWN_IMAGE_HOSTS), re.IGNORECASE
+)
+
+# Any <img> tag, and the src attribute of one (double-quoted, single-quoted or bare)
+# Quoted attribute values are skipped whole, so "src=" inside e.g. a title is ignored
+IMG_TAG_PATTERN = re.compile(r"<img\b", re.IGNORECASE)
+IMG_SRC_PATTERN = re.compile(
+    r"""<img\b(?:[^>"']|"[^"]*"|'[^']*')*?(?<![\w-])src\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
+
+# Comments and <script>/<style> blocks, whose <img> tags a parser never sees
+HIDDEN_HTML_PATTERN = re.compile(
+    r"<!--.*?(?:-->|$)|<(script|style)\b.*?(?:</\1\s*>|$)", re.IGNORECASE | re.DOTALL
+)
+
+# Placeholder/tracking patterns to skip when picking <img> tags from feed HTML
+PLACEHOLDER_IMAGE_PATTERN = re.compile(
+    r"pixel|spacer|blank|1x1|tracking|beacon|analytics|gravatar|avatar", re.IGNORECASE
+)
+
 # Valid image MIME types
 IMAGE_MIME_TYPES = {
     "image/jpeg",
@@ -25,6 +109,21 @@ IMAGE_MIME_TYPES = {
     "image/bmp",
 }
 
+# Browser-like headers for fetching source article pages
+SCRAPE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+# Bytes read per chunk when streaming article pages
+SCRAPE_CHUNK_SIZE = 4096
+
+# Maximum concurrent async fetches against a single host
+SCRAPE_HOST_CONCURRENCY = 16
+
+# Timeout for async article fetches (connect, total) in seconds
+SCRAPE_TIMEOUT = aiohttp.ClientTimeout(connect=10, total=40)
+
 # BLOCKED domains - never use images from these (ads, adult, tracking, etc.)
 BLOCKED_IMAGE_DOMAINS = {
     # Ad networks
@@ -63,6 +162,80 @@ BLOCKED_IMAGE_DOMAINS = {
     "istockphoto",
     "gettyimages",
 }
+BLOCKED_IMAGE_DOMAIN_PATTERN = re.compile(
+    "|".join(re.escape(blocked) for blocked in sorted(BLOCKED_IMAGE_DOMAINS)), re.IGNORECASE
+)
+
+# Shared keep-alive session for article fetches, so repeated scrapes of the
+# same athletics site reuse pooled connections instead of new TLS handshakes
+_SESSION = create_http_session(
+    timeout=(10, 30),
+    max_retries=2,
+    backoff_factor=0.3,
+    pool_connections=32,
+    pool_maxsize=64,
+)
+_SESSION.headers.update(SCRAPE_HEADERS)
+
+# Definitive HEAD check results per URL (see validate_via_head)
+HEAD_CHECK_CACHE_SIZE = 1024
+_HEAD_CHECKS: dict[str, bool] = {}
+
+# (site, CDN host pattern) pairs whose images count as same-domain for the site
+TRUSTED_CDN_PATTERNS = (
+    ("careyathletics.com", "sidearm"),  # Sidearm Sports CDN
+    ("careyathletics.com", "sidearmsports"),
+    ("careyathletics.com", "prestosports"),
+)
+
+# <picture><source> srcset lookups, in priority order, compiled once at import
+PICTURE_SOURCE_XPATHS = [
+    (selector, etree.XPath(path, smart_strings=False))
+    for selector, path in [
+        ("article picture source", "//article//picture//source/@srcset"),
+        (".article-content picture source",
+         f"//*[{xpath_has_class('article-content')}]//picture//source/@srcset"),
+        (".story-content picture source",
+         f"//*[{xpath_has_class('story-content')}]//picture//source/@srcset"),
+        (".hero-image picture source",
+         f"//*[{xpath_has_class('hero-image')}]//picture//source/@srcset"),
+        (".featured-image picture source",
+         f"//*[{xpath_has_class('featured-image')}]//picture//source/@srcset"),
+        ("picture source", "//picture//source/@srcset"),
+    ]
+]
+
+OG_IMAGE_XPATH = etree.XPath("(//meta[@property='og:image'])[1]/@content", smart_strings=False)
+TWITTER_IMAGE_XPATH = etree.XPath("(//meta[@name='twitter:image'])[1]/@content", smart_strings=False)
+
+# Hero/article <img> lookups, in priority order (first match per selector)
+# Each is (selector, match kind, name): an <img> under a tag, an <img> under
+# a class, or any element carrying the class itself
+HERO_IMAGE_SELECTORS = [
+    ("article img", "img_in_tag", "article"),
+    (".article-content img", "img_in_class", "article-content"),
+    (".story-content img", "img_in_class", "story-content"),
+    (".hero-image img", "img_in_class", "hero-image"),
+    (".featured-image img", "img_in_class", "featured-image"),
+    (".article-image img", "img_in_class", "article-image"),
+    (".story-image img", "img_in_class", "story-image"),
+    (".post-thumbnail img", "img_in_class", "post-thumbnail"),
+    (".wp-post-image", "class", "wp-post-image"),
+    ("figure img", "img_in_tag", "figure"),
+]
+
+# Union of all hero selectors, so candidates are collected in one tree walk
+HERO_IMAGE_XPATH = etree.XPath(
+    "//*[(self::img and ("
+    + " or ".join(
+        f"ancestor::{name}" if kind == "img_in_tag" else f"ancestor::*[{xpath_has_class(name)}]"
+        for _, kind, name in HERO_IMAGE_SELECTORS
+        if kind != "class"
+    )
+    + ")) or "
+    + " or ".join(xpath_has_class(name) for _, kind, name in HERO_IMAGE_SELECTORS if kind == "class")
+    + "]"
+)
 
 
 def is_image_domain_blocked(url: str) -> bool:
@@ -78,16 +251,24 @@ def is_image_domain_blocked(url: str) -> bool:
         return True
     
     try:
-        url_lower = url.lower()
-        for blocked in BLOCKED_IMAGE_DOMAINS:
-            if blocked in url_lower:
-                logger.debug("blocked_image_domain", url=url, blocked_pattern=blocked)
-                return True
+        match = BLOCKED_IMAGE_DOMAIN_PATTERN.search(url)
+        if match:
+            logger.debug("blocked_image_domain", url=url, blocked_pattern=match.group(0).lower())
+            return True
         return False
     except Exception:
         return True
 
 
+@lru_cache(maxsize=2048)
+def _comparable_domain(url: str) -> str:
+    """Get a URL's netloc lowercased and without www. for domain comparison.
+
+    Memoized - the same article and CDN URLs are compared repeatedly per page.
+    """
+    return urlparse(url).netloc.lower().replace("www.", "")
+
+
 def is_same_domain(source_url: str, image_url: str) -> bool:
     """Check if image URL is from the same domain as source.
     
@@ -102,15 +283,9 @@ def is_same_domain(source_url: str, image_url: str) -> bool:
         return False
         
     try:
-        source_parsed = urlparse(source_url)
-        image_parsed = urlparse(image_url)
-        
-        source_domain = source_parsed.netloc.lower()
-        image_domain = image_parsed.netloc.lower()
-        
-        # Remove www. prefix for comparison
-        source_domain = source_domain.replace("www.", "")
-        image_domain = image_domain.replace("www.", "")
+        # Lowercased netlocs without www. prefix, computed once per URL
+        source_domain = _comparable_domain(source_url)
+        image_domain = _comparable_domain(image_url)
         
         # Exact match
         if source_domain == image_domain:
@@ -121,13 +296,7 @@ def is_same_domain(source_url: str, image_url: str) -> bool:
             return True
         
         # Allow CDN patterns for known athletics sites
-        trusted_cdn_patterns = [
-            ("careyathletics.com", "sidearm"),  # Sidearm Sports CDN
-            ("careyathletics.com", "sidearmsports"),
-            ("careyathletics.com", "prestosports"),
-        ]
-        
-        for site, cdn_pattern in trusted_cdn_patterns:
+        for site, cdn_pattern in TRUSTED_CDN_PATTERNS:
             if site in source_domain and cdn_pattern in image_domain:
                 return True
         
@@ -154,100 +323,27 @@ def scrape_image_from_url(url: str) -> Optional[str]:
     """
     if not url:
         return None
+
+    hit, image_url = _cached_scrape(url)
+    if hit:
+        return image_url
     
     logger.info("scraping_image_from_url", url=url)
     
     try:
-        response = requests.get(
-            url,
-            timeout=(10, 30),
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            }
-        )
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, "html.parser")
-        
-        # 1. Check <picture><source srcset> tags (HIGHEST PRIORITY)
-        # Athletics sites like careyathletics.com use responsive images
-        # Example: <source media="(min-width:768px)" srcset="/images/2026/1/15/DSC_3570.jpg?width=647...">
-        picture_selectors = [
-            "article picture source",
-            ".article-content picture source",
-            ".story-content picture source", 
-            ".hero-image picture source",
-            ".featured-image picture source",
-            "picture source",
-        ]
-        
-        for selector in picture_selectors:
-            sources = soup.select(selector)
-            for source in sources:
-                srcset = source.get("srcset")
-                if srcset:
-                    # Parse srcset - take the first URL (before any space/descriptor)
-                    # Example: "/images/2026/1/15/DSC_3570.jpg?width=647&quality=80 1x, /images/... 2x"
-                    first_src = srcset.split(",")[0].strip().split()[0]
-                    if first_src:
-                        # Resolve relative URLs
-                        if not first_src.startswith(("http://", "https://")):
-                            first_src = urljoin(url, first_src)
-                        
-                        if is_valid_image_url(first_src) and not is_image_domain_blocked(first_src):
-                            logger.info("found_srcset_image", url=first_src, selector=selector)
-                            return first_src
-        
-        # 2. Check og:image meta tag (TRUSTED - from source page meta)
-        og_image = soup.find("meta", property="og:image")
-        if og_image and og_image.get("content"):
-            image_url = og_image["content"]
-            if is_valid_image_url(image_url) and not is_image_domain_blocked(image_url):
-                logger.info("found_og_image", url=image_url)
-                return image_url
+        # Stream the page so the download can stop at a top-priority image
+        with get_with_timeout(_SESSION, url, stream=True) as response:
+            response.raise_for_status()
+
+            scanner = _PageImageScanner(url, response.headers.get("Content-Type", ""))
+            for chunk in response.iter_content(chunk_size=SCRAPE_CHUNK_SIZE):
+                image_url = scanner.feed(chunk)
+                if image_url:
+                    break
             else:
-                logger.debug("og_image_rejected", image_url=image_url, reason="blocked or invalid")
-        
-        # 3. Check twitter:image meta tag (TRUSTED - from source page meta)
-        twitter_image = soup.find("meta", attrs={"name": "twitter:image"})
-        if twitter_image and twitter_image.get("content"):
-            image_url = twitter_image["content"]
-            if is_valid_image_url(image_url) and not is_image_domain_blocked(image_url):
-                logger.info("found_twitter_image", url=image_url)
-                return image_url
-        
-        # 4. Look for featured/hero <img> tags
-        # These require same-domain validation (more likely to be ads)
-        hero_selectors = [
-            "article img",
-            ".article-content img",
-            ".story-content img",
-            ".hero-image img",
-            ".featured-image img",
-            ".article-image img",
-            ".story-image img",
-            ".post-thumbnail img",
-            ".wp-post-image",
-            "figure img",
-        ]
-        
-        for selector in hero_selectors:
-            img = soup.select_one(selector)
-            if img:
-                src = img.get("src") or img.get("data-src")
-                if src:
-                    # Resolve relative URLs
-                    if not src.startswith(("http://", "https://")):
-                        src = urljoin(url, src)
-                    
-                    # Strict validation for scraped img tags (same domain + not blocked)
-                    if is_valid_image_url(src) and is_same_domain(url, src) and not is_image_domain_blocked(src):
-                        logger.info("found_hero_image", url=src, selector=selector)
-                        return src
-        
-        logger.debug("no_safe_image_found_in_source", url=url)
-        return None
+                image_url = scanner.close()
+
+        return _remember_scrape(url, image_url)
         
     except requests.RequestException as e:
         logger.warning("image_scrape_request_error", url=url, error=str(e))
@@ -256,6 +352,353 @@ def scrape_image_from_url(url: str) -> Optional[str]:
         logger.warning("image_scrape_error", url=url, error=str(e))
         return None
 
+
+async def scrape_image_from_url_async(
+    session: aiohttp.ClientSession,
+    url: str,
+) -> Optional[str]:
+    """Async version of scrape_image_from_url using a shared aiohttp session.
+
+    Args:
+        session: Open aiohttp session to issue the request with.
+        url: URL of the article to scrape.
+
+    Returns:
+        Image URL or None.
+    """
+    if not url:
+        return None
+
+    # The cache is SQLite on disk, so keep its reads and writes off the loop
+    hit, image_url = await asyncio.to_thread(_cached_scrape, url)
+    if hit:
+        return image_url
+
+    logger.info("scraping_image_from_url", url=url)
+
+    try:
+        # Stream the page through the same scanner as the sync path
+        async with session.get(url, timeout=SCRAPE_TIMEOUT) as response:
+            response.raise_for_status()
+
+            scanner = _PageImageScanner(url, response.headers.get("Content-Type", ""))
+            async for chunk in response.content.iter_chunked(SCRAPE_CHUNK_SIZE):
+                image_url = scanner.feed(chunk)
+                if image_url:
+                    break
+            else:
+                image_url = scanner.close()
+
+        return await asyncio.to_thread(_remember_scrape, url, image_url)
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning("image_scrape_request_error", url=url, error=str(e))
+        return None
+    except Exception as e:
+        logger.warning("image_scrape_error", url=url, error=str(e))
+        return None
+
+
+async def scrape_many(urls: list[str]) -> list[Optional[str]]:
+    """Scrape images from several article URLs concurrently.
+
+    Args:
+        urls: Article URLs to scrape.
+
+    Returns:
+        Image URL or None for each input URL, in the same order.
+    """
+    # Open the cache once up front rather than racing to create it per task
+    await asyncio.to_thread(_get_scrape_cache)
+
+    async with _client_session() as session:
+        results = await asyncio.gather(
+            *(scrape_image_from_url_async(session, url) for url in urls),
+            return_exceptions=True,
+        )
+
+    return [None if isinstance(result, BaseException) else result for result in results]
+
+
+def scrape_images(urls: list[str]) -> list[Optional[str]]:
+    """Synchronous entrypoint for scrape_many.
+
+    Args:
+        urls: Article URLs to scrape.
+
+    Returns:
+        Image URL or None for each input URL, in the same order.
+    """
+    if not urls:
+        return []
+
+    return asyncio.run(scrape_many(urls))
+
+
+def _client_session() -> aiohttp.ClientSession:
+    """Create an aiohttp session for concurrent article scraping.
+
+    Must be called from inside a running event loop.
+
+    Returns:
+        Session with browser headers and a per-host connection limit.
+    """
+    return aiohttp.ClientSession(
+        headers=SCRAPE_HEADERS,
+        connector=aiohttp.TCPConnector(limit_per_host=SCRAPE_HOST_CONCURRENCY),
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_scrape_cache() -> Optional[ImageScrapeCache]:
+    """Open the on-disk scrape cache once per process.
+
+    Returns:
+        The cache, or None if it can't be opened (scraping still works).
+    """
+    try:
+        return ImageScrapeCache()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("image_cache_unavailable", error=str(e))
+        return None
+
+
+def _cached_scrape(url: str) -> tuple[bool, Optional[str]]:
+    """Look up a previous scrape result for an article URL.
+
+    Returns:
+        Tuple of (hit, image_url).
+    """
+    cache = _get_scrape_cache()
+    if cache is None:
+        return (False, None)
+    return cache.get(url)
+
+
+def _remember_scrape(url: str, image_url: Optional[str]) -> Optional[str]:
+    """Store a scrape result (including "no image found") and pass it through."""
+    cache = _get_scrape_cache()
+    if cache is not None:
+        cache.set(url, image_url)
+    return image_url
+
+
+class _PageImageScanner:
+    """Incrementally parse an article page while it downloads.
+
+    Top-priority images (<article><picture><source srcset>) are reported as
+    soon as they are parsed so the caller can stop reading the response.
+    """
+
+    def __init__(self, url: str, content_type: str = ""):
+        """Initialize the scanner.
+
+        Args:
+            url: URL the page is fetched from (for resolving relative URLs).
+            content_type: Content-Type header of the response, for its charset.
+        """
+        self.url = url
+        self._content_type = content_type
+        self._head = b""
+        self._parser: Optional[etree.HTMLPullParser] = None
+
+    def feed(self, chunk: bytes) -> Optional[str]:
+        """Parse the next chunk of the page.
+
+        Args:
+            chunk: Raw HTML bytes.
+
+        Returns:
+            Image URL if a top-priority image was found, None to keep reading.
+        """
+        if self._parser is None:
+            # Hold the start of the page until its encoding can be sniffed
+            self._head += chunk
+            if len(self._head) < ENCODING_SNIFF_SIZE:
+                return None
+            chunk = self._start_parser()
+
+        self._parser.feed(chunk)
+        for _, source in self._parser.read_events():
+            if not _in_article_picture(source):
+                continue
+            image_url = _srcset_image(source.get("srcset"), self.url)
+            if image_url:
+                logger.info("found_srcset_image", url=image_url, selector="article picture source")
+                return image_url
+        return None
+
+    def close(self) -> Optional[str]:
+        """Finish parsing and run the full priority chain on the page.
+
+        Returns:
+            Image URL or None (also for an empty page).
+        """
+        if self._parser is None:
+            if not self._head:
+                logger.debug("empty_source_page", url=self.url)
+                return None
+            # Short page - everything is still in the sniffing buffer
+            head = self._start_parser()
+            self._parser.feed(head)
+
+        tree = self._parser.close()
+        if tree is None:
+            logger.debug("empty_source_page", url=self.url)
+            return None
+        return _find_image_in_tree(tree, self.url)
+
+    def _start_parser(self) -> bytes:
+        """Create the pull parser for the sniffed encoding.
+
+        Returns:
+            The buffered start of the page, to be fed to the new parser.
+        """
+        self._parser = etree.HTMLPullParser(
+            events=("end",),
+            tag="source",
+            encoding=sniff_encoding(self._content_type, self._head),
+        )
+        head, self._head = self._head, b""
+        return head
+
+
+def _in_article_picture(source: etree._Element) -> bool:
+    """Check if a <source> element sits inside <article> ... <picture>."""
+    in_picture = False
+    for ancestor in source.iterancestors():
+        if ancestor.tag == "picture":
+            in_picture = True
+        elif ancestor.tag == "article" and in_picture:
+            return True
+    return False
+
+
+def _srcset_image(srcset: Optional[str], url: str) -> Optional[str]:
+    """Resolve and validate the first URL of a srcset attribute.
+
+    Args:
+        srcset: srcset attribute value.
+        url: URL of the page the attribute came from.
+
+    Returns:
+        Absolute image URL, or None if missing, invalid or blocked.
+    """
+    if not srcset:
+        return None
+
+    # Parse srcset - take the first URL (before any space/descriptor)
+    # Example: "/images/2026/1/15/DSC_3570.jpg?width=647&quality=80 1x, /images/... 2x"
+    first_src = srcset.split(",")[0].strip().split()[0]
+    if not first_src:
+        return None
+
+    # Resolve relative URLs
+    if not first_src.startswith(("http://", "https://")):
+        first_src = urljoin(url, first_src)
+
+    if is_valid_image_url(first_src) and not is_image_domain_blocked(first_src):
+        return first_src
+    return None
+
+
+def _find_image_in_tree(tree: etree._Element, url: str) -> Optional[str]:
+    """Pick the best image from a parsed article page.
+
+    Args:
+        tree: Root element of the parsed page.
+        url: URL the page was fetched from (for resolving relative URLs).
+
+    Returns:
+        Image URL or None.
+    """
+    # 1. Check <picture><source srcset> tags (HIGHEST PRIORITY)
+    # Athletics sites like careyathletics.com use responsive images
+    # Example: <source media="(min-width:768px)" srcset="/images/2026/1/15/DSC_3570.jpg?width=647...">
+    for selector, xpath in PICTURE_SOURCE_XPATHS:
+        for srcset in xpath(tree):
+            image_url = _srcset_image(srcset, url)
+            if image_url:
+                logger.info("found_srcset_image", url=image_url, selector=selector)
+                return image_url
+
+    # 2. Check og:image meta tag (TRUSTED - from source page meta)
+    og_image = OG_IMAGE_XPATH(tree)
+    if og_image and og_image[0]:
+        image_url = og_image[0].strip()
+        if is_valid_image_url(image_url) and not is_image_domain_blocked(image_url):
+            logger.info("found_og_image", url=image_url)
+            return image_url
+        else:
+            logger.debug("og_image_rejected", image_url=image_url, reason="blocked or invalid")
+
+    # 3. Check twitter:image meta tag (TRUSTED - from source page meta)
+    twitter_image = TWITTER_IMAGE_XPATH(tree)
+    if twitter_image and twitter_image[0]:
+        image_url = twitter_image[0].strip()
+        if is_valid_image_url(image_url) and not is_image_domain_blocked(image_url):
+            logger.info("found_twitter_image", url=image_url)
+            return image_url
+
+    # 4. Look for featured/hero <img> tags
+    # These require same-domain validation (more likely to be ads)
+    for selector, img in _first_hero_matches(tree):
+        # Templates often pad attribute values with whitespace/newlines
+        src = (img.get("src") or img.get("data-src") or "").strip()
+        if src:
+            # Resolve relative URLs
+            if not src.startswith(("http://", "https://")):
+                src = urljoin(url, src)
+
+            # Strict validation for scraped img tags (same domain + not blocked)
+            if is_valid_image_url(src) and is_same_domain(url, src) and not is_image_domain_blocked(src):
+                logger.info("found_hero_image", url=src, selector=selector)
+                return src
+
+    logger.debug("no_safe_image_found_in_source", url=url)
+    return None
+
+
+def _first_hero_matches(tree: etree._Element) -> list[tuple[str, etree._Element]]:
+    """Find the first element matching each hero selector.
+
+    Walks the tree once with HERO_IMAGE_XPATH, then assigns candidates to
+    selectors by looking at their ancestors.
+
+    Args:
+        tree: Root element of the parsed page.
+
+    Returns:
+        (selector, element) pairs in HERO_IMAGE_SELECTORS priority order.
+    """
+    first_matches: dict[int, etree._Element] = {}
+
+    for element in HERO_IMAGE_XPATH(tree):
+        ancestor_tags = set()
+        ancestor_classes = set()
+        if element.tag == "img":
+            for ancestor in element.iterancestors():
+                ancestor_tags.add(ancestor.tag)
+                ancestor_classes.update((ancestor.get("class") or "").split())
+        own_classes = (element.get("class") or "").split()
+
+        for index, (_, kind, name) in enumerate(HERO_IMAGE_SELECTORS):
+            if index in first_matches:
+                continue
+            if (
+                (kind == "img_in_tag" and name in ancestor_tags)
+                or (kind == "img_in_class" and name in ancestor_classes)
+                or (kind == "class" and name in own_classes)
+            ):
+                first_matches[index] = element
+
+        if len(first_matches) == len(HERO_IMAGE_SELECTORS):
+            break
+
+    return [(HERO_IMAGE_SELECTORS[index][0], first_matches[index]) for index in sorted(first_matches)]
+
+
+@lru_cache(maxsize=4096)
 def is_valid_image_url(url: str) -> bool:
     """Check if URL appears to be a valid image.
 
@@ -269,68 +712,28 @@ def is_valid_image_url(url: str) -> bool:
         return False
 
     try:
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
+        # Split host/path/query with one match instead of building a ParseResult;
+        # anything that isn't an absolute http(s) URL is rejected here.
+        # Surrounding whitespace is ignored, as urlparse does
+        parts = HTTP_URL_PATTERN.match(url.strip())
+        if not parts:
             return False
+        netloc, path, query = parts.groups(default="")
 
         # Check extension - handle query strings by looking at path only
         # Example: /images/DSC_3570.jpg?width=647 -> check .jpg
-        path_lower = parsed.path.lower()
-        
-        # Split off any trailing slashes and check file extension
-        path_parts = path_lower.rstrip('/').split('/')
-        if path_parts:
-            filename = path_parts[-1]
-            for ext in IMAGE_EXTENSIONS:
-                if ext in filename:  # Use 'in' to catch .jpg?... patterns
-                    return True
+        if IMAGE_EXTENSION_PATTERN.search(path):
+            return True
         
         # Check query params for format indicators (used by image CDNs)
         # Example: ?format=jpg or ?type=jpeg or ?image_path=...jpg
-        query_lower = parsed.query.lower()
-        if "format=jpg" in query_lower or "format=jpeg" in query_lower or "format=png" in query_lower:
-            return True
-        if "type=jpg" in query_lower or "type=jpeg" in query_lower or "type=png" in query_lower:
-            return True
-        # BMCU/Sidearm uses image_path=/images/...jpg format
-        if "image_path=" in query_lower and (".jpg" in query_lower or ".jpeg" in query_lower or ".png" in query_lower):
+        if query and IMAGE_QUERY_PATTERN.search(query):
             return True
 
         # Some CDN URLs don't have extensions but are still valid
         # Allow URLs from known image CDNs and athletics sites
-        known_image_hosts = [
-            "pexels.com",
-            "unsplash.com", 
-            "cloudinary.com",
-            "imgix.net",
-            "wp.com",
-            "wordpress.com",
-            "flickr.com",
-            "staticflickr.com",
-            "sidearm",  # Sidearm Sports CDN used by athletics sites
-            "prestosports",  # Presto Sports CDN
-            "bmcusports.com",  # Blue Mountain Christian athletics
-            "careyathletics.com",  # William Carey athletics
-            "nwccrangers.com",  # Northwest Mississippi CC athletics
-            "coahomasports.com",  # Coahoma CC athletics
-            "gostatesmen.com",  # Delta State athletics
-            "mvsusports.com",  # Mississippi Valley State athletics
-            "alcornsports.com",  # Alcorn State athletics
-            "gojsutigers.com",  # Jackson State athletics
-            "southernmiss.com",  # Southern Miss athletics
-            "hailstate.com",  # Mississippi State athletics
-            "olemisssports.com",  # Ole Miss athletics
-            "gochoctaws.com",  # Mississippi College athletics
-            "blazers.belhaven.edu",  # Belhaven University athletics
-            "gomajors.com",  # Millsaps College athletics
-            "owlsathletics.com",  # Mississippi University for Women athletics
-            "sports.hindscc.edu",  # Hinds Community College athletics
-            "jcbobcats.com",  # Jones College athletics
-            "southwestbearathletics.com",  # Southwest Mississippi Community College athletics
-        ]
-        for host in known_image_hosts:
-            if host in parsed.netloc.lower():
-                return True
+        if KNOWN_IMAGE_HOST_PATTERN.search(netloc):
+            return True
 
         return False
 
@@ -339,6 +742,41 @@ def is_valid_image_url(url: str) -> bool:
 
 
 
+def validate_via_head(url: str) -> bool:
+    """Check if a URL serves an image using a HEAD request.
+
+    Only the response headers are transferred, so this is a cheap way to
+    accept image URLs that is_valid_image_url can't recognize. Answers are
+    remembered for the process, except for request errors and 5xx
+    responses, which may be transient.
+
+    Args:
+        url: URL to check.
+
+    Returns:
+        True if the server reports an image Content-Type.
+    """
+    if not url or not HTTP_URL_PATTERN.match(url):
+        return False
+
+    if url in _HEAD_CHECKS:
+        return _HEAD_CHECKS[url]
+
+    try:
+        response = _SESSION.head(url, allow_redirects=True, timeout=(5, 10))
+    except requests.RequestException as e:
+        logger.debug("image_head_check_error", url=url, error=str(e))
+        return False
+
+    content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+    logger.debug("image_head_check", url=url, status=response.status_code, content_type=content_type)
+    is_image = response.ok and content_type in IMAGE_MIME_TYPES
+
+    if response.status_code < 500 and len(_HEAD_CHECKS) < HEAD_CHECK_CACHE_SIZE:
+        _HEAD_CHECKS[url] = is_image
+    return is_image
+
+
 def find_rss_image(entry: dict[str, Any], base_url: str = "") -> Optional[str]:
     """Find an image URL from an RSS entry.
 
@@ -357,54 +795,25 @@ def find_rss_image(entry: dict[str, Any], base_url: str = "") -> Optional[str]:
     """
     image_url = None
 
-    # 1. Check media:content (media_content in feedparser)
-    if "media_content" in entry and entry["media_content"]:
-        for media in entry["media_content"]:
-            url = media.get("url", "")
-            media_type = media.get("type", "")
-            medium = media.get("medium", "")
-
-            # Check if it's an image
-            if media_type in IMAGE_MIME_TYPES or medium == "image":
-                if is_valid_image_url(url):
-                    image_url = url
-                    logger.debug("found_media_content_image", url=url)
-                    break
-            elif is_valid_image_url(url):
-                image_url = url
-                logger.debug("found_media_content_image", url=url)
-                break
+    # 1-4. Check media:content, media:thumbnail, enclosures and image links,
+    # in that order of preference. Every candidate gets the offline checks
+    # before any network request is spent on one
+    candidates = [candidate for candidate in _iter_media_candidates(entry) if candidate[1]]
 
-    # 2. Check media:thumbnail (media_thumbnail in feedparser)
-    if not image_url and "media_thumbnail" in entry and entry["media_thumbnail"]:
-        for thumb in entry["media_thumbnail"]:
-            url = thumb.get("url", "")
-            if is_valid_image_url(url):
+    for source, url, mime_type, _ in candidates:
+        if mime_type in IMAGE_MIME_TYPES or is_valid_image_url(url):
+            image_url = url
+            logger.debug(source, url=url)
+            break
+    else:
+        # Media that may be an image but whose URL doesn't look like one (e.g.
+        # extensionless CDN handlers) gets a HEAD request to check the Content-Type
+        for source, url, _, probe in candidates:
+            if probe and validate_via_head(url):
                 image_url = url
-                logger.debug("found_media_thumbnail", url=url)
+                logger.debug(source, url=url, validated_via="head")
                 break
 
-    # 3. Check enclosures
-    if not image_url and "enclosures" in entry and entry["enclosures"]:
-        for enclosure in entry["enclosures"]:
-            enc_type = enclosure.get("type", "")
-            url = enclosure.get("href", "") or enclosure.get("url", "")
-            if enc_type in IMAGE_MIME_TYPES or is_valid_image_url(url):
-                if url:
-                    image_url = url
-                    logger.debug("found_enclosure_image", url=url)
-                    break
-
-    # 4. Check links for image type
-    if not image_url and "links" in entry and entry["links"]:
-        for link in entry["links"]:
-            if link.get("type", "") in IMAGE_MIME_TYPES:
-                url = link.get("href", "")
-                if url:
-                    image_url = url
-                    logger.debug("found_link_image", url=url)
-                    break
-
     # 5. Parse images from content/summary HTML
     if not image_url:
         html_content = ""
@@ -426,6 +835,49 @@ def find_rss_image(entry: dict[str, Any], base_url: str = "") -> Optional[str]:
     return image_url
 
 
+def _iter_media_candidates(entry: dict[str, Any]) -> Iterator[tuple[str, str, Optional[str], bool]]:
+    """Yield candidate image URLs from an entry's media elements in priority order.
+
+    Candidates carrying a MIME type are trusted when it is an image type;
+    those yielded with None must pass is_valid_image_url. Candidates marked
+    for probing may still be accepted by a HEAD request.
+
+    Args:
+        entry: RSS entry dictionary from feedparser.
+
+    Yields:
+        Tuples of (log_event, url, mime_type, probe).
+    """
+    # media:content (media_content in feedparser)
+    for media in entry.get("media_content") or ():
+        yield "found_media_content_image", media.get("url", ""), None, _may_be_image(media)
+
+    # media:thumbnail (media_thumbnail in feedparser)
+    for thumb in entry.get("media_thumbnail") or ():
+        yield "found_media_thumbnail", thumb.get("url", ""), None, True
+
+    # Enclosures
+    for enclosure in entry.get("enclosures") or ():
+        url = enclosure.get("href", "") or enclosure.get("url", "")
+        yield "found_enclosure_image", url, enclosure.get("type", ""), False
+
+    # Links with an image type (other links point at the article itself)
+    for link in entry.get("links") or ():
+        link_type = link.get("type", "")
+        if link_type in IMAGE_MIME_TYPES:
+            yield "found_link_image", link.get("href", ""), link_type, False
+
+
+def _may_be_image(media: dict[str, Any]) -> bool:
+    """Check if a media:content element is untyped or declared as an image.
+
+    Video and audio media are never worth a HEAD request.
+    """
+    media_type = (media.get("type") or "").lower()
+    medium = (media.get("medium") or "").lower()
+    return (not media_type or media_type.startswith("image/")) and medium in ("", "image")
+
+
 def extract_first_image_from_html(html: str, base_url: str = "") -> Optional[str]:
     """Extract the first image URL from HTML content.
 
@@ -437,38 +889,58 @@ def extract_first_image_from_html(html: str, base_url: str = "") -> Optional[str
         Image URL or None.
     """
     try:
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Find all img tags
-        for img in soup.find_all("img"):
-            src = img.get("src", "")
-            if not src:
-                continue
+        # Scan <img src="..."> tags lexically - feed HTML is short and only
+        # the first usable image is needed, so no tree is built. Markup a
+        # parser would ignore is stripped first
+        html = HIDDEN_HTML_PATTERN.sub("", html)
+        matched = False
+        for match in IMG_SRC_PATTERN.finditer(html):
+            matched = True
+            src = unescape(match.group(1) or match.group(2) or match.group(3) or "")
+            image_url = _html_image_candidate(src, base_url)
+            if image_url:
+                logger.debug("found_html_image", url=image_url)
+                return image_url
 
-            # Skip common placeholder/tracking patterns
-            skip_patterns = [
-                "pixel",
-                "spacer",
-                "blank",
-                "1x1",
-                "tracking",
-                "beacon",
-                "analytics",
-                "gravatar",
-                "avatar",
-            ]
-            if any(pattern in src.lower() for pattern in skip_patterns):
-                continue
+        # Fall back to a real parse only for markup the pattern can't see
+        if matched or not IMG_TAG_PATTERN.search(html):
+            return None
 
-            # Resolve relative URLs
-            if base_url and not src.startswith(("http://", "https://")):
-                src = urljoin(base_url, src)
+        root = lxml_html.fromstring(html)
 
-            if is_valid_image_url(src):
-                logger.debug("found_html_image", url=src)
-                return src
+        # Find all img tags
+        for img in root.iter("img"):
+            image_url = _html_image_candidate(img.get("src", ""), base_url)
+            if image_url:
+                logger.debug("found_html_image", url=image_url)
+                return image_url
 
     except Exception as e:
         logger.warning("html_image_extraction_error", error=str(e))
 
     return None
+
+
+def _html_image_candidate(src: str, base_url: str) -> Optional[str]:
+    """Resolve and validate an <img> src taken from feed HTML.
+
+    Args:
+        src: Raw src attribute value.
+        base_url: Base URL for resolving relative URLs.
+
+    Returns:
+        Image URL, or None if empty, a placeholder, or not an image.
+    """
+    src = src.strip()
+    if not src:
+        return None
+
+    # Skip common placeholder/tracking patterns
+    if PLACEHOLDER_IMAGE_PATTERN.search(src):
+        return None
+
+    # Resolve relative URLs
+    if base_url and not src.startswith(("http://", "https://")):
+        src = urljoin(base_url, src)
+
+    return src if is_valid_image_url(src) else None
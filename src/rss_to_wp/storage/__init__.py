@@ -1,5 +1,6 @@
 """Storage module."""
 
 from rss_to_wp.storage.dedupe import DedupeStore
+from rss_to_wp.storage.image_cache import ImageScrapeCache
 
-__all__ = ["DedupeStore"]
+__all__ = ["DedupeStore", "ImageScrapeCache"]
@@ -0,0 +1,113 @@
+"""SQLite-based cache of images scraped from article pages."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from rss_to_wp.config import get_data_dir
+from rss_to_wp.utils import get_logger
+
+logger = get_logger("storage.image_cache")
+
+
+class ImageScrapeCache:
+    """SQLite-based store for image URLs scraped from article pages.
+
+    Negative results ("no image found") are cached too, so fruitless pages
+    are not re-scraped on every run.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, ttl_hours: int = 24):
+        """Initialize the image scrape cache.
+
+        Args:
+            db_path: Path to SQLite database. Defaults to data/image_cache.db
+            ttl_hours: How long a cached result stays valid.
+        """
+        if db_path is None:
+            db_path = get_data_dir() / "image_cache.db"
+
+        self.db_path = db_path
+        self.ttl = timedelta(hours=ttl_hours)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize the database schema and drop expired results."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS scraped_images (
+                    page_url TEXT PRIMARY KEY,
+                    image_url TEXT,
+                    scraped_at TIMESTAMP NOT NULL
+                )
+            """)
+            conn.execute(
+                "DELETE FROM scraped_images WHERE scraped_at < ?",
+                (self._cutoff(),),
+            )
+            conn.commit()
+
+        logger.debug("image_cache_initialized", path=str(self.db_path))
+
+    @contextmanager
+    def _get_connection(self):
+        """Get a database connection context manager."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _cutoff(self) -> str:
+        """Get the oldest scraped_at timestamp that is still valid."""
+        return (datetime.utcnow() - self.ttl).isoformat()
+
+    def get(self, page_url: str) -> tuple[bool, Optional[str]]:
+        """Look up the cached scrape result for an article page.
+
+        Args:
+            page_url: URL of the article page.
+
+        Returns:
+            Tuple of (hit, image_url). image_url is None for a cached
+            "no image found" result or a miss.
+        """
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    "SELECT image_url FROM scraped_images WHERE page_url = ? AND scraped_at >= ?",
+                    (page_url, self._cutoff()),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("image_cache_read_error", url=page_url, error=str(e))
+            return (False, None)
+
+        if row is None:
+            return (False, None)
+
+        logger.debug("image_cache_hit", url=page_url, image_url=row[0])
+        return (True, row[0])
+
+    def set(self, page_url: str, image_url: Optional[str]) -> None:
+        """Store the scrape result for an article page.
+
+        Args:
+            page_url: URL of the article page.
+            image_url: Image found on the page, or None if there was none.
+        """
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO scraped_images (page_url, image_url, scraped_at)
+                    VALUES (?, ?, ?)
+                    """,
+                    (page_url, image_url, datetime.utcnow().isoformat()),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("image_cache_write_error", url=page_url, error=str(e))
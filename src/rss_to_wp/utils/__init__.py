@@ -1,6 +1,7 @@
 """Utility modules."""
 
 from rss_to_wp.utils.email import build_summary_email, send_email_notification
+from rss_to_wp.utils.html import ENCODING_SNIFF_SIZE, sniff_encoding, xpath_has_class
 from rss_to_wp.utils.http import (
     create_http_session,
     fetch_url_content,
@@ -18,4 +19,7 @@ __all__ = [
     "setup_logging",
     "send_email_notification",
     "build_summary_email",
+    "ENCODING_SNIFF_SIZE",
+    "sniff_encoding",
+    "xpath_has_class",
 ]
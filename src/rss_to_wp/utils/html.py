@@ -0,0 +1,64 @@
+"""HTML parsing helpers shared by the page scrapers."""
+
+from __future__ import annotations
+
+import codecs
+import re
+
+from bs4.dammit import EncodingDetector
+
+# Bytes of a page to look through for a byte order mark or <meta> charset
+# (the HTML spec's prescan window)
+ENCODING_SNIFF_SIZE = 1024
+
+# charset parameter of a Content-Type header
+CHARSET_PATTERN = re.compile(r"""charset\s*=\s*["']?([^\s;"']+)""", re.IGNORECASE)
+
+
+def xpath_has_class(name: str) -> str:
+    """Build the XPath test for an element carrying a CSS class (".name").
+
+    Args:
+        name: CSS class name.
+
+    Returns:
+        XPath predicate expression, to use inside [...].
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def sniff_encoding(content_type: str, head: bytes) -> str:
+    """Pick the encoding to parse a streamed HTML page with.
+
+    Uses the Content-Type charset, then a byte order mark or <meta>/XML
+    declaration in the start of the page, and otherwise assumes UTF-8
+    rather than libxml2's Latin-1 default.
+
+    Args:
+        content_type: Content-Type header of the response (may be empty).
+        head: Start of the body, at least ENCODING_SNIFF_SIZE bytes if the
+            page is that long.
+
+    Returns:
+        Encoding name.
+    """
+    header_charset = CHARSET_PATTERN.search(content_type or "")
+    _, bom_encoding = EncodingDetector.strip_byte_order_mark(head)
+
+    for encoding in (
+        header_charset and header_charset.group(1),
+        bom_encoding,
+        EncodingDetector.find_declared_encoding(head, is_html=True),
+    ):
+        if encoding and _is_known_encoding(encoding):
+            return encoding
+    return "utf-8"
+
+
+def _is_known_encoding(encoding: str) -> bool:
+    """Check if Python (and so lxml) knows an encoding name."""
+    try:
+        codecs.lookup(encoding)
+        return True
+    except LookupError:
+        return False
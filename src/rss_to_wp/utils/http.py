@@ -19,6 +19,8 @@ def create_http_session(
     timeout: tuple[int, int] = (10, 30),
     max_retries: int = 3,
     backoff_factor: float = 0.5,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
 ) -> requests.Session:
     """Create a configured requests session with retry logic.
 
@@ -26,6 +28,8 @@ def create_http_session(
         timeout: Tuple of (connect_timeout, read_timeout) in seconds.
         max_retries: Maximum number of retries for failed requests.
         backoff_factor: Multiplier for exponential backoff between retries.
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum connections kept alive per host.
 
     Returns:
         Configured requests.Session object.
@@ -40,7 +44,11 @@ def create_http_session(
         allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"],
     )
 
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
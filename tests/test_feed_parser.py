@@ -0,0 +1,68 @@
+"""Tests for article page scraping in rss_to_wp.feeds.parser."""
+
+import requests
+
+from rss_to_wp.feeds import parser
+
+ARTICLE_TEXT = "Game recap café — “quote” " + "word " * 60
+
+
+def _fake_response(body: bytes, content_type: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.raw = _ChunkedRaw(body)
+    return response
+
+
+class _ChunkedRaw:
+    """Minimal stand-in for urllib3's response stream."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def stream(self, chunk_size, decode_content=True):
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+
+def _scrape(monkeypatch, body: bytes, content_type: str = "text/html"):
+    monkeypatch.setattr(parser.requests, "get", lambda *args, **kwargs: _fake_response(body, content_type))
+    return parser.scrape_article_content("https://example.com/story")
+
+
+def test_undeclared_charset_defaults_to_utf8(monkeypatch):
+    body = f"<html><body><article>{ARTICLE_TEXT}</article></body></html>".encode("utf-8")
+
+    assert _scrape(monkeypatch, body) == ARTICLE_TEXT.strip()
+
+
+def test_header_charset_is_used(monkeypatch):
+    text = "Game recap café " + "word " * 60
+    body = f"<html><body><article>{text}</article></body></html>".encode("latin-1")
+
+    assert _scrape(monkeypatch, body, "text/html; charset=ISO-8859-1") == text.strip()
+
+
+def test_meta_charset_is_used(monkeypatch):
+    text = "Game recap café " + "word " * 60
+    body = (
+        '<html><head><meta charset="windows-1252"></head>'
+        f"<body><article>{text}</article></body></html>"
+    ).encode("cp1252")
+
+    assert _scrape(monkeypatch, body) == text.strip()
+
+
+def test_removed_elements_do_not_glue_words(monkeypatch):
+    body = (
+        "<html><body><article>"
+        f"Rebels<script>track()</script>win<style>p {{}}</style><nav>Menu</nav>again {ARTICLE_TEXT}"
+        "</article></body></html>"
+    ).encode("utf-8")
+
+    assert _scrape(monkeypatch, body) == f"Rebels win again {ARTICLE_TEXT.strip()}"
@@ -0,0 +1,71 @@
+"""Tests for rss_to_wp.storage.image_cache."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from rss_to_wp.storage import ImageScrapeCache, image_cache
+
+PAGE_URL = "https://site.com/news/story"
+START = datetime(2026, 1, 15, 12, 0, 0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for the cache module's datetime."""
+
+    class _Clock(datetime):
+        now_value = START
+
+        @classmethod
+        def utcnow(cls):
+            return cls.now_value
+
+    monkeypatch.setattr(image_cache, "datetime", _Clock)
+    return _Clock
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return ImageScrapeCache(db_path=tmp_path / "image_cache.db")
+
+
+def test_miss_for_unknown_page(cache):
+    assert cache.get(PAGE_URL) == (False, None)
+
+
+def test_image_is_cached(cache):
+    cache.set(PAGE_URL, "https://site.com/hero.jpg")
+
+    assert cache.get(PAGE_URL) == (True, "https://site.com/hero.jpg")
+
+
+def test_no_image_is_cached(cache):
+    cache.set(PAGE_URL, None)
+
+    assert cache.get(PAGE_URL) == (True, None)
+
+
+@pytest.mark.parametrize(
+    "age, expected",
+    [
+        (timedelta(hours=23), (True, None)),
+        (timedelta(hours=25), (False, None)),
+    ],
+    ids=["within-ttl", "expired"],
+)
+def test_results_expire_after_ttl(cache, clock, age, expected):
+    cache.set(PAGE_URL, None)
+    clock.now_value = START + age
+
+    assert cache.get(PAGE_URL) == expected
+
+
+def test_expired_results_are_dropped_on_open(tmp_path, clock):
+    db_path = tmp_path / "image_cache.db"
+    ImageScrapeCache(db_path=db_path).set(PAGE_URL, "https://site.com/hero.jpg")
+    clock.now_value = START + timedelta(hours=25)
+    ImageScrapeCache(db_path=db_path)
+    clock.now_value = START
+
+    assert ImageScrapeCache(db_path=db_path).get(PAGE_URL) == (False, None)
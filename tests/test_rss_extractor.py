@@ -0,0 +1,223 @@
+"""Tests for image lookups in rss_to_wp.images.rss_extractor."""
+
+import pytest
+import requests
+
+from rss_to_wp.images import rss_extractor
+
+PAGE_URL = "https://site.com/news/story"
+
+
+class _ChunkedRaw:
+    """Minimal stand-in for urllib3's response stream."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def stream(self, chunk_size, decode_content=True):
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+
+class _MemoryCache:
+    """In-memory stand-in for ImageScrapeCache."""
+
+    def __init__(self):
+        self.results = {}
+
+    def get(self, page_url):
+        if page_url in self.results:
+            return (True, self.results[page_url])
+        return (False, None)
+
+    def set(self, page_url, image_url):
+        self.results[page_url] = image_url
+
+
+@pytest.fixture
+def scrape_cache(monkeypatch):
+    cache = _MemoryCache()
+    monkeypatch.setattr(rss_extractor, "_get_scrape_cache", lambda: cache)
+    return cache
+
+
+def _scrape(monkeypatch, body: bytes, content_type: str = "text/html"):
+    def fake_get(session, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = content_type
+        response.raw = _ChunkedRaw(body)
+        return response
+
+    monkeypatch.setattr(rss_extractor, "get_with_timeout", fake_get)
+    return rss_extractor.scrape_image_from_url(PAGE_URL)
+
+
+@pytest.mark.parametrize("body", [b"", b"  \n"])
+def test_empty_page_is_cached_as_no_image(monkeypatch, scrape_cache, body):
+    assert _scrape(monkeypatch, body) is None
+    assert scrape_cache.results == {PAGE_URL: None}
+
+
+@pytest.mark.parametrize(
+    "body, content_type, expected",
+    [
+        # No charset anywhere: UTF-8, not libxml2's Latin-1 default
+        (
+            '<html><head><meta property="og:image" content="https://site.com/café.jpg"></head></html>'.encode(),
+            "text/html",
+            "https://site.com/café.jpg",
+        ),
+        (
+            '<html><body><article><img src="/img/café.jpg"></article></body></html>'.encode(),
+            "text/html",
+            "https://site.com/img/café.jpg",
+        ),
+        # Header charset
+        (
+            '<html><head><meta property="og:image" content="https://site.com/café.jpg"></head></html>'.encode("latin-1"),
+            "text/html; charset=ISO-8859-1",
+            "https://site.com/café.jpg",
+        ),
+        # <meta> charset, past the first network chunk
+        (
+            (
+                '<html><head><meta charset="windows-1252">'
+                + "<!-- padding -->" * 300
+                + '<meta property="og:image" content="https://site.com/café.jpg"></head></html>'
+            ).encode("cp1252"),
+            "text/html",
+            "https://site.com/café.jpg",
+        ),
+    ],
+    ids=["undeclared-og-image", "undeclared-hero", "header-charset", "meta-charset"],
+)
+def test_page_encoding(monkeypatch, scrape_cache, body, content_type, expected):
+    assert _scrape(monkeypatch, body, content_type) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://site.com/og.jpg",
+        "\n  https://site.com/og.jpg  ",
+        " https://cdn.sidearm.com/photo?id=1\t",
+    ],
+)
+def test_valid_image_url_ignores_surrounding_whitespace(url):
+    assert rss_extractor.is_valid_image_url(url)
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        (
+            b'<html><head><meta property="og:image" content="\n  https://site.com/og.jpg  "></head></html>',
+            "https://site.com/og.jpg",
+        ),
+        (
+            b'<html><head><meta name="twitter:image" content=" https://site.com/tw.jpg\n"></head></html>',
+            "https://site.com/tw.jpg",
+        ),
+        (
+            b'<html><body><article><img src="\n /img/hero.jpg "></article></body></html>',
+            "https://site.com/img/hero.jpg",
+        ),
+    ],
+    ids=["og-image", "twitter-image", "hero"],
+)
+def test_padded_attribute_values(monkeypatch, scrape_cache, body, expected):
+    assert _scrape(monkeypatch, body) == expected
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        (
+            b'<html><body><figure><img src="/figure.jpg"></figure>'
+            b'<article><img src="/article.jpg"></article></body></html>',
+            "https://site.com/article.jpg",
+        ),
+        (
+            b'<html><body><div class="hero-image"><img src="/hero.jpg"></div>'
+            b'<div class="main article-content"><img src="/content.jpg"></div></body></html>',
+            "https://site.com/content.jpg",
+        ),
+        (
+            b'<html><body><figure><img src="/figure.jpg"></figure>'
+            b'<img class="size-full wp-post-image" src="/wp.jpg"></body></html>',
+            "https://site.com/wp.jpg",
+        ),
+        (
+            b'<html><body><article><img src="/first.jpg"><img src="/second.jpg"></article></body></html>',
+            "https://site.com/first.jpg",
+        ),
+        (
+            b'<html><body><article><img src="https://ads.example.net/ad.jpg">'
+            b'<img src="/second.jpg"></article>'
+            b'<figure><img src="/figure.jpg"></figure></body></html>',
+            "https://site.com/figure.jpg",
+        ),
+        (
+            b'<html><body><div class="wp-post-image" data-src="/lazy.jpg"></div></body></html>',
+            "https://site.com/lazy.jpg",
+        ),
+        (
+            b'<html><body><span class="wp-post-image" src="/span.jpg"></span></body></html>',
+            "https://site.com/span.jpg",
+        ),
+    ],
+    ids=[
+        "article-over-figure",
+        "article-content-over-hero-image",
+        "wp-post-image-over-figure",
+        "first-match-in-selector",
+        "only-first-match-per-selector",
+        "wp-post-image-data-src-on-div",
+        "wp-post-image-src-on-span",
+    ],
+)
+def test_hero_image_selectors(monkeypatch, scrape_cache, body, expected):
+    assert _scrape(monkeypatch, body) == expected
+
+
+@pytest.mark.parametrize(
+    "html, expected",
+    [
+        ('<p><img src="/a.jpg"></p>', "https://e.com/a.jpg"),
+        ('<!-- <img src="/c.jpg"> --><img src="/d.jpg">', "https://e.com/d.jpg"),
+        ('<script>var s = \'<img src="/c.jpg">\';</script><img src="/d.jpg">', "https://e.com/d.jpg"),
+        ('<style>/* <img src="/c.jpg"> */</style><img src="/d.jpg">', "https://e.com/d.jpg"),
+        ('<img title=\'src="/fake.jpg"\' src="/real.jpg">', "https://e.com/real.jpg"),
+        ('<img data-src="/lazy.jpg" src="/real.jpg">', "https://e.com/real.jpg"),
+        ('<img alt="a > b" src="/real.jpg">', "https://e.com/real.jpg"),
+        ("<IMG SRC=/bare.jpg>", "https://e.com/bare.jpg"),
+        ('<img src="/a.jpg?w=1&amp;h=2">', "https://e.com/a.jpg?w=1&h=2"),
+        ('<img src="/spacer.gif"><img src="/real.jpg">', "https://e.com/real.jpg"),
+        ('<img src=""><img src="  "><img src="/real.jpg">', "https://e.com/real.jpg"),
+        ('<!-- <img src="/c.jpg">', None),
+        ('<img src="">', None),
+        ("<p>No images here</p>", None),
+    ],
+    ids=[
+        "plain",
+        "comment",
+        "script-string",
+        "style",
+        "quoted-src-in-other-attribute",
+        "data-src-before-src",
+        "gt-in-attribute",
+        "bare-uppercase",
+        "entity-escaped",
+        "placeholder-skipped",
+        "empty-src-skipped",
+        "unterminated-comment",
+        "empty-src",
+        "no-img",
+    ],
+)
+def test_extract_first_image_from_html(html, expected):
+    assert rss_extractor.extract_first_image_from_html(html, base_url="https://e.com/p") == expected